@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from typing import TYPE_CHECKING, cast
 
 from homeassistant.const import CONF_SCAN_INTERVAL, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from tadoasync import TadoAuthenticationError
+from aiohttp import ClientResponseError
+from tadoasync import (
+    TadoAuthenticationError,
+    TadoBadRequestError,
+    TadoConnectionError,
+    TadoError,
+)
 
 from .const import (
     CONF_API_PROXY_URL,
@@ -27,7 +36,7 @@ from .const import (
 from .coordinator import TadoDataUpdateCoordinator
 from .helpers.client import TadoHijackClient
 from .helpers.logging_utils import (
-    TadoRedactionFilter,
+    SHARED_REDACTION_FILTER,
     get_redacted_logger,
     set_redacted_log_level,
 )
@@ -39,14 +48,21 @@ if TYPE_CHECKING:
 
 apply_patches()
 
-logging.getLogger("tadoasync").addFilter(TadoRedactionFilter())
-logging.getLogger("tadoasync.tadoasync").addFilter(TadoRedactionFilter())
+logging.getLogger("tadoasync").addFilter(SHARED_REDACTION_FILTER)
+logging.getLogger("tadoasync.tadoasync").addFilter(SHARED_REDACTION_FILTER)
 
 _LOGGER = get_redacted_logger(__name__)
 
 
 type TadoConfigEntry = ConfigEntry[TadoDataUpdateCoordinator]
 
+# Spellings of the debug log level accepted from config entry data.
+_DEBUG_LEVEL_ALIASES = frozenset({"DEBUG", "debug", "Debug"})
+
+# Legacy unique_id patterns removed by the v4/v7 migrations below.
+_HW_LEGACY_RE = re.compile(r"_(?:climate_)?hw_")
+_OWD_LEGACY_RE = re.compile(r"open_window_detection|owd")
+
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.SWITCH,
@@ -63,79 +79,93 @@ async def async_migrate_entry(hass: HomeAssistant, entry: TadoConfigEntry) -> bo
     """Migrate old entry."""
     _LOGGER.debug("Migrating from version %s", entry.version)
 
-    if entry.version == 1:
-        entry.version = 2
+    # Accumulate all data changes into a single shallow copy and issue one
+    # async_update_entry at the end instead of one per version bump.
+    new_data = dict(entry.data)
+    version = entry.version
+
+    if version == 1:
+        version = 2
 
-    if entry.version == 2:
+    if version == 2:
         # scan_interval fix
-        new_data = {**entry.data}
         if new_data.get(CONF_SCAN_INTERVAL) == 1800:
             _LOGGER.info("Migrating scan_interval to 3600s (v3)")
             new_data[CONF_SCAN_INTERVAL] = 3600
-        hass.config_entries.async_update_entry(entry, data=new_data, version=3)
+        version = 3
 
-    if entry.version == 3:
+    if version == 3:
         # Introduction of Presence Polling
-        new_data = {**entry.data}
         if CONF_PRESENCE_POLL_INTERVAL not in new_data:
             _LOGGER.info("Introducing presence_poll_interval (v4)")
             new_data[CONF_PRESENCE_POLL_INTERVAL] = new_data.get(
                 CONF_SCAN_INTERVAL, DEFAULT_PRESENCE_POLL_INTERVAL
             )
-        hass.config_entries.async_update_entry(entry, data=new_data, version=4)
+        version = 4
 
-    if entry.version == 4:
-        # Cleanup of legacy hot water entities
-        _LOGGER.info("Migrating to version 5: Cleaning up legacy hot water entities")
-        from homeassistant.helpers import entity_registry as er
+    # Cleanup of legacy hot water entities (v5)
+    cleanup_legacy_hw = version == 4
+    if cleanup_legacy_hw:
+        version = 5
 
-        ent_reg = er.async_get(hass)
-        entries = er.async_entries_for_config_entry(ent_reg, entry.entry_id)
-        for entity in entries:
-            if "_hw_" in entity.unique_id or "_climate_hw_" in entity.unique_id:
-                _LOGGER.info(
-                    "Removing legacy entity %s (unique_id: %s)",
-                    entity.entity_id,
-                    entity.unique_id,
-                )
-                ent_reg.async_remove(entity.entity_id)
-
-        hass.config_entries.async_update_entry(entry, version=5)
-
-    if entry.version < 6:
+    if version < 6:
         # Reset intervals to defaults to fix unit confusion
         _LOGGER.info("Migrating to version 6: Resetting intervals to defaults")
-        new_data = {
-            **entry.data,
-            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,  # gitleaks:allow
-        }
+        new_data[CONF_SCAN_INTERVAL] = DEFAULT_SCAN_INTERVAL  # gitleaks:allow
         new_data[CONF_PRESENCE_POLL_INTERVAL] = (
             DEFAULT_PRESENCE_POLL_INTERVAL  # gitleaks:allow
         )
         new_data[CONF_SLOW_POLL_INTERVAL] = DEFAULT_SLOW_POLL_INTERVAL  # gitleaks:allow
-        hass.config_entries.async_update_entry(entry, data=new_data, version=6)
+        version = 6
 
-    if entry.version < 7:
-        # Cleanup open window detection switch entities (replaced by number)
-        _LOGGER.info(
-            "Migrating to version 7: Cleaning up legacy open window detection switch entities"
-        )
-        from homeassistant.helpers import entity_registry as er
+    # Cleanup open window detection switch entities (replaced by number, v7)
+    cleanup_legacy_owd = version < 7
+    if cleanup_legacy_owd:
+        version = 7
 
+    if cleanup_legacy_hw or cleanup_legacy_owd:
         ent_reg = er.async_get(hass)
         entries = er.async_entries_for_config_entry(ent_reg, entry.entry_id)
-        for e in entries:
-            if e.domain == "switch" and (
-                "open_window_detection" in e.unique_id or "owd" in e.unique_id
-            ):
+        remove = ent_reg.async_remove
+        removed: set[str] = set()
+
+        if cleanup_legacy_hw:
+            _LOGGER.info(
+                "Migrating to version 5: Cleaning up legacy hot water entities"
+            )
+            stale = [
+                (entity.entity_id, entity.unique_id)
+                for entity in entries
+                if _HW_LEGACY_RE.search(entity.unique_id)
+            ]
+            for entity_id, unique_id in stale:
+                _LOGGER.info(
+                    "Removing legacy entity %s (unique_id: %s)", entity_id, unique_id
+                )
+                remove(entity_id)
+                removed.add(entity_id)
+
+        if cleanup_legacy_owd:
+            _LOGGER.info(
+                "Migrating to version 7: Cleaning up legacy open window detection switch entities"
+            )
+            stale = [
+                (e.entity_id, e.unique_id)
+                for e in entries
+                if e.domain == "switch"
+                and e.entity_id not in removed
+                and _OWD_LEGACY_RE.search(e.unique_id)
+            ]
+            for entity_id, unique_id in stale:
                 _LOGGER.info(
                     "Removing legacy open window detection entity %s (unique_id: %s)",
-                    e.entity_id,
-                    e.unique_id,
+                    entity_id,
+                    unique_id,
                 )
-                ent_reg.async_remove(e.entity_id)
+                remove(entity_id)
 
-        hass.config_entries.async_update_entry(entry, version=7)
+    if version != entry.version:
+        hass.config_entries.async_update_entry(entry, data=new_data, version=version)
 
     _LOGGER.info("Migration to version %s successful", entry.version)
     return True
@@ -166,7 +196,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: TadoConfigEntry) -> bool
     client = TadoHijackClient(
         refresh_token=entry.data[CONF_REFRESH_TOKEN],
         session=async_get_clientsession(hass),
-        debug=(log_level.upper() == "DEBUG"),
+        debug=(log_level in _DEBUG_LEVEL_ALIASES),
         proxy_url=proxy_url,
         proxy_token=proxy_token,
     )
@@ -178,27 +208,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: TadoConfigEntry) -> bool
             getattr(client, "_home_id", None),
             "SET" if getattr(client, "_access_token", None) else "NOT SET",
         )
-    except TadoAuthenticationError as e:
+    except (TadoAuthenticationError, TadoBadRequestError) as e:
         _LOGGER.error("Authentication failed during setup: %s", e)
         raise ConfigEntryAuthFailed from e
-    except Exception as e:
-        if "timeout" in str(e).lower():
-            _LOGGER.warning("Timeout connecting to Tado API, will retry: %s", e)
-            raise ConfigEntryNotReady from e
-
-        _LOGGER.error("Failed to initialize Tado API: %s", e)
-        error_str = str(e).lower()
-        if (
-            "bad request" in error_str
-            or "400" in error_str
-            or "401" in error_str
-            or "unauthorized" in error_str
-            or ("invalid" in error_str and "token" in error_str)
-        ):
+    except ClientResponseError as e:
+        if e.status in (400, 401):
             _LOGGER.warning(
-                "Token likely invalid (HTTP 400/401 or auth error), triggering reauth"
+                "Token likely invalid (HTTP %d), triggering reauth", e.status
             )
             raise ConfigEntryAuthFailed from e
+        _LOGGER.error("Failed to initialize Tado API: %s", e)
+        raise ConfigEntryNotReady from e
+    except (TadoConnectionError, TimeoutError) as e:
+        _LOGGER.warning("Timeout connecting to Tado API, will retry: %s", e)
+        raise ConfigEntryNotReady from e
+    except TadoError as e:
+        _LOGGER.error("Failed to initialize Tado API: %s", e)
         raise ConfigEntryNotReady from e
 
     from .const import CONF_GENERATION, GEN_CLASSIC
@@ -224,9 +249,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: TadoConfigEntry) -> bool
 
     entry.runtime_data = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    await async_setup_services(hass, coordinator)
+    # Platform setup and service registration are independent; overlap them.
+    await asyncio.gather(
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        async_setup_services(hass, coordinator),
+    )
 
     return True
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -60,12 +60,12 @@ class TadoGenericHomeBinarySensor(
     ) -> None:
         """Initialize the generic home binary sensor."""
         TadoHomeEntity.__init__(
-            self, coordinator, cast(str, definition["translation_key"])
+            self, coordinator, definition.translation_key
         )
         TadoGenericEntityMixin.__init__(self, definition)
-        self._set_entity_id("binary_sensor", definition["key"])
+        self._set_entity_id("binary_sensor", definition.key)
         self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{self._get_unique_id_suffix()}"
+            f"{coordinator.entry_id}_{self._get_unique_id_suffix()}"
         )
 
 
@@ -85,7 +85,7 @@ class TadoGenericZoneBinarySensor(
         TadoZoneEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             zone_id,
             zone_name,
         )
@@ -95,7 +95,12 @@ class TadoGenericZoneBinarySensor(
 class TadoGenericDeviceBinarySensor(
     TadoDeviceEntity, TadoGenericEntityMixin, BinarySensorEntity
 ):
-    """Generic binary sensor for Device scope."""
+    """Generic binary sensor for Device scope.
+
+    Device state (battery, connectivity) only changes with coordinator
+    data, so the value is computed once per update instead of on every
+    state read.
+    """
 
     def __init__(
         self,
@@ -108,7 +113,7 @@ class TadoGenericDeviceBinarySensor(
         TadoDeviceEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             device.serial_no,
             device.short_serial_no,
             device.device_type,
@@ -116,6 +121,17 @@ class TadoGenericDeviceBinarySensor(
             device.current_fw_version,
         )
         TadoGenericEntityMixin.__init__(self, definition)
+        self._attr_is_on = bool(self._get_actual_value())
+
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached value once per coordinator update."""
+        self._attr_is_on = bool(self._get_actual_value())
+        super()._handle_coordinator_update()
+
+    @property
+    def is_on(self) -> bool:
+        """Return the cached value."""
+        return bool(self._attr_is_on)
 
 
 class TadoGenericBridgeBinarySensor(
@@ -133,8 +149,8 @@ class TadoGenericBridgeBinarySensor(
         TadoBridgeEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             bridge.serial_no,
         )
         TadoGenericEntityMixin.__init__(self, definition)
-        self._set_entity_id("binary_sensor", definition["key"])
+        self._set_entity_id("binary_sensor", definition.key)
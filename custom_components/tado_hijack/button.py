@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -53,10 +53,10 @@ class TadoGenericHomeButton(TadoHomeEntity, TadoGenericEntityMixin, ButtonEntity
     ) -> None:
         """Initialize the generic home button."""
         TadoHomeEntity.__init__(
-            self, coordinator, cast(str, definition["translation_key"])
+            self, coordinator, definition.translation_key
         )
         TadoGenericEntityMixin.__init__(self, definition)
-        self._set_entity_id("button", definition["key"])
+        self._set_entity_id("button", definition.key)
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -77,7 +77,7 @@ class TadoGenericZoneButton(TadoZoneEntity, TadoGenericEntityMixin, ButtonEntity
         TadoZoneEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             zone_id,
             zone_name,
         )
@@ -102,7 +102,7 @@ class TadoGenericDeviceButton(TadoDeviceEntity, TadoGenericEntityMixin, ButtonEn
         TadoDeviceEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             device.serial_no,
             device.short_serial_no,
             device.device_type,
@@ -110,7 +110,7 @@ class TadoGenericDeviceButton(TadoDeviceEntity, TadoGenericEntityMixin, ButtonEn
             device.current_fw_version,
         )
         TadoGenericEntityMixin.__init__(self, definition)
-        self._set_entity_id("button", definition["key"])
+        self._set_entity_id("button", definition.key)
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -149,7 +149,7 @@ class TadoClimateEntity(
     @property
     def _current_state(self) -> Any:
         """Return actual state from coordinator data."""
-        return self.tado_coordinator.data.zone_states.get(str(self._zone_id))
+        return self.tado_coordinator.data.zone_states.get(self._zone_id_str)
 
     def _get_active_hvac_mode(self) -> HVACMode:
         """Return the HVAC mode to show when power is ON. Subclasses must implement."""
@@ -356,7 +356,7 @@ class TadoAirConditioning(TadoClimateEntity):
             min_temp,
         )
         self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_climate_ac_{zone_id}"
+            f"{coordinator.entry_id}_climate_ac_{zone_id}"
         )
         self._attr_hvac_modes = [HVACMode.OFF, HVACMode.COOL, HVACMode.AUTO]
         self._store_last_state("vertical_swing", "OFF")
@@ -723,7 +723,7 @@ class TadoHeating(TadoClimateEntity):
             min_temp=5.0,
         )
         self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_climate_heating_{zone_id}"
+            f"{coordinator.entry_id}_climate_heating_{zone_id}"
         )
 
     def _get_active_hvac_mode(self) -> HVACMode:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.core import (
@@ -102,12 +105,23 @@ from .helpers.rate_limit_manager import RateLimitManager
 from .helpers.reset_window_tracker import ResetWindowTracker
 from .helpers.state_patcher import patch_zone_overlay, patch_zone_resume
 from .helpers.storage import TadoStorage
+from .helpers.zone_utils import zone_key
 from .helpers.utils import apply_jitter
-from .models import CommandType, RateLimit, TadoCommand, TadoData
+from .models import CommandType, TadoCommand, TadoData
 
 _LOGGER = get_redacted_logger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _interval_td(seconds: float) -> timedelta:
+    """Return a shared timedelta for a polling interval.
+
+    The set of plausible intervals is tiny, so the cache lets entry reloads
+    and interval recalculations reuse the same instances.
+    """
+    return timedelta(seconds=seconds)
+
+
 class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
     """Orchestrates Tado integration logic via specialized managers."""
 
@@ -120,6 +134,9 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
     ):
         """Initialize Tado coordinator."""
         self._tado = client
+        # Cached so entity unique_id construction avoids walking
+        # coordinator -> config_entry -> entry_id per entity.
+        self.entry_id = entry.entry_id
 
         self.generation = entry.data.get(CONF_GENERATION, GEN_CLASSIC)
 
@@ -152,7 +169,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             raise ValueError(f"Unknown generation: {self.generation}")
 
         update_interval = (
-            timedelta(seconds=scan_interval) if scan_interval > 0 else None
+            _interval_td(scan_interval) if scan_interval > 0 else None
         )
 
         super().__init__(
@@ -242,18 +259,27 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
         self.zones_meta: dict[int, Zone | HopsRoomSnapshot] = {}
         self.devices_meta: dict[str, Device] = {}
+        # Heating-only zone snapshot, rebuilt with each metadata refresh.
+        self.heating_zones: tuple[Zone | HopsRoomSnapshot, ...] = ()
         self.bridges: list[Device] = []
+        self.bridges_by_serial: dict[str, Device] = {}
         self._climate_to_zone: dict[str, int] = {}
         self._polling_calls_today = 0
         self._last_quota_reset: datetime | None = None
         self._last_remaining: int | None = None
         self._force_next_update: bool = False
+        # Monotonic clock snapshot, refreshed once per update cycle so the
+        # bookkeeping in that cycle shares a single clock read.
+        self._mono_now: float = time.monotonic()
 
         # Adaptive quota reset window learning
         self.reset_tracker = ResetWindowTracker()
         self.storage = TadoStorage(hass, entry.entry_id)
 
         self.poll_scheduler = PollScheduler(hass)
+        # Prebuilt callback shared by every scheduled refresh, instead of
+        # allocating a fresh closure per scheduled poll.
+        self._silent_zone_poll = lambda: self.async_manual_poll("zone", silent=True)
         self.api_manager.start(entry)
         self.event_handler.setup()
         self._schedule_reset_poll()
@@ -282,9 +308,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
         Should only be called for v3 Classic generation.
         """
-        for zone in self.zones_meta.values():
-            if zone.type != ZONE_TYPE_HEATING:
-                continue
+        for zone in self.heating_zones:
             for device in zone.devices:
                 if climate_id := get_climate_entity_id(self.hass, device.serial_no):
                     self._climate_to_zone[climate_id] = zone.id
@@ -367,6 +391,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             _LOGGER.info("No data exists, allowing initial fetch despite throttling")
 
         try:
+            self._mono_now = time.monotonic()
             quota_start = self.rate_limit.remaining
             _LOGGER.debug("Starting data fetch (quota: %d)", quota_start)
 
@@ -374,16 +399,18 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
             self.zones_meta = self.data_manager.zones_meta
             self.devices_meta = self.data_manager.devices_meta
+            self.heating_zones = self.data_manager.heating_zones_cached
 
             from .helpers.discovery import get_bridges
 
             self.bridges = get_bridges(self.devices_meta, self.generation)
+            self.bridges_by_serial = {b.serial_no: b for b in self.bridges}
 
             if self.generation == GEN_CLASSIC and not self.full_cloud_mode:
                 self._update_climate_map()
 
             self.auth_manager.check_and_update_token()
-            self.optimistic.cleanup()
+            self.optimistic.cleanup(self._mono_now)
 
             self.rate_limit.sync_from_headers()
 
@@ -393,15 +420,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
             self._detect_quota_reset()
 
-            setattr(
-                data,
-                "rate_limit",
-                RateLimit(
-                    limit=self.rate_limit.limit,
-                    remaining=self.rate_limit.remaining,
-                ),
-            )
-            setattr(data, "api_status", self.rate_limit.api_status)
+            self._sync_rate_limit_snapshot(data)
 
             self._adjust_interval_for_auto_quota()
 
@@ -583,7 +602,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
         if calculated_interval is None:
             self.update_interval = (
-                timedelta(seconds=self._base_scan_interval)
+                _interval_td(self._base_scan_interval)
                 if self._base_scan_interval > 0
                 else None
             )
@@ -599,7 +618,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                 final_interval = apply_jitter(final_interval, jitter_percent)
                 _LOGGER.debug("Applied jitter to interval: %s", final_interval)
 
-            self.update_interval = timedelta(seconds=final_interval)
+            self.update_interval = _interval_td(final_interval)
 
     def _schedule_reset_poll(self) -> None:
         """Schedule automatic poll at daily quota reset time."""
@@ -664,14 +683,12 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
     def _schedule_expiry_poll(self, delay_s: int) -> None:
         """Schedule a poll to run when a timer expires."""
-        self.poll_scheduler.schedule_expiry_poll(
-            delay_s, lambda: self.async_manual_poll("zone", silent=True)
-        )
+        self.poll_scheduler.schedule_expiry_poll(delay_s, self._silent_zone_poll)
 
     def _schedule_queued_refresh(self) -> None:
         """Schedule a debounced refresh after a resume/off action."""
         self.poll_scheduler.schedule_queued_refresh(
-            RESUME_REFRESH_DELAY_S, lambda: self.async_manual_poll("zone", silent=True)
+            RESUME_REFRESH_DELAY_S, self._silent_zone_poll
         )
 
     def shutdown(self) -> None:
@@ -700,23 +717,40 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             TadoCommand(CommandType.MANUAL_POLL, data={"type": refresh_type}),
         )
 
+    def _sync_rate_limit_snapshot(self, data: Any) -> None:
+        """Mirror rate limit counters into the data snapshot in place.
+
+        RateLimit is a mutable slotted dataclass, so post-action syncs just
+        store two attributes instead of allocating a new snapshot per call.
+        """
+        snapshot = data.rate_limit
+        snapshot.limit = self.rate_limit.limit
+        snapshot.remaining = self.rate_limit.remaining
+        data.api_status = self.rate_limit.api_status
+
     def update_rate_limit_local(self, silent: bool = False) -> None:
         """Update local stats and sync internal remaining from headers."""
         self.rate_limit.sync_from_headers()
-        self.data.rate_limit = RateLimit(
-            limit=self.rate_limit.limit,
-            remaining=self.rate_limit.remaining,
-        )
-        self.data.api_status = self.rate_limit.api_status
+        self._sync_rate_limit_snapshot(self.data)
         if not silent:
             self.async_update_listeners()
 
     async def async_sync_states(self, types: list[str]) -> None:
-        """Targeted refresh after worker actions."""
+        """Targeted refresh after worker actions.
+
+        The requested fetches are independent HTTP calls, so they run
+        concurrently instead of serializing the round-trips.
+        """
+        tasks: dict[str, Any] = {}
         if "presence" in types:
-            self.data.home_state = await self._tado.get_home_state()
+            tasks["home_state"] = self._tado.get_home_state()
         if "zone" in types:
-            self.data.zone_states = await self._tado.get_zone_states()
+            tasks["zone_states"] = self._tado.get_zone_states()
+
+        if tasks:
+            results = await asyncio.gather(*tasks.values())
+            for key, value in zip(tasks, results, strict=True):
+                setattr(self.data, key, value)
 
         self.update_rate_limit_local(silent=False)
 
@@ -759,7 +793,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         operation_mode: str | None = None,
     ) -> None:
         """Apply optimistic overlay state and queue the SET_OVERLAY command."""
-        old_state = patch_zone_overlay(self.data.zone_states.get(str(zone_id)), data)
+        old_state = patch_zone_overlay(self.data.zone_states.get(zone_key(zone_id)), data)
         self.optimistic.apply_zone_state(
             zone_id,
             overlay=True,
@@ -782,7 +816,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         self, zone_id: int, operation_mode: str | None = None
     ) -> None:
         """Apply optimistic resume state and queue the RESUME_SCHEDULE command."""
-        old_state = patch_zone_resume(self.data.zone_states.get(str(zone_id)))
+        old_state = patch_zone_resume(self.data.zone_states.get(zone_key(zone_id)))
         self.optimistic.apply_zone_state(
             zone_id, overlay=False, operation_mode=operation_mode
         )
@@ -882,7 +916,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         self, zone_id: int, temperature: float | None = None
     ) -> None:
         """Set hot water zone to heat mode (manual overlay)."""
-        state = self.data.zone_states.get(str(zone_id))
+        state = self.data.zone_states.get(zone_key(zone_id))
         temp = temperature or TEMP_DEFAULT_HOT_WATER
 
         # If no temp provided, try to get from current state as fallback
@@ -1018,12 +1052,12 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             self.update_interval = None
         elif new_interval_s is None:
             self.update_interval = (
-                timedelta(seconds=self._base_scan_interval)
+                _interval_td(self._base_scan_interval)
                 if self._base_scan_interval > 0
                 else None
             )
         else:
-            self.update_interval = timedelta(seconds=new_interval_s)
+            self.update_interval = _interval_td(new_interval_s)
 
     async def async_set_child_lock(self, serial_no: str, enabled: bool) -> None:
         """Set child lock for a device."""
@@ -1261,7 +1295,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             additional_setting_fields=additional_setting_fields,
         )
 
-        old_state = patch_zone_overlay(self.data.zone_states.get(str(zone_id)), data)
+        old_state = patch_zone_overlay(self.data.zone_states.get(zone_key(zone_id)), data)
 
         self.optimistic.apply_zone_state(
             zone_id,
@@ -1333,7 +1367,7 @@ class TadoDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             )
 
             old_state = patch_zone_overlay(
-                self.data.zone_states.get(str(zone_id)), data
+                self.data.zone_states.get(zone_key(zone_id)), data
             )
 
             self.api_manager.queue_command(
@@ -249,8 +249,8 @@ def _get_internal_state_diagnostics(
 
     return {
         "optimistic": {
-            "zones_count": len(opt._store.get("zone", {})),
-            "devices_count": len(opt._store.get("device", {})),
+            "zones_count": len({k[1] for k in opt._store if k[0] == "zone"}),
+            "devices_count": len({k[1] for k in opt._store if k[0] == "device"}),
             "presence_global": opt.get_presence(),
         },
         "api_manager": {
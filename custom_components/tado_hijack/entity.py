@@ -26,22 +26,26 @@ class TadoDefinitionMixin:
         """Initialize the definition mixin."""
         self._definition = definition
 
-        if icon := definition.get("icon"):
+        if icon := definition.icon:
             self._attr_icon = icon
-        if device_class := definition.get("ha_device_class"):
+        if device_class := definition.ha_device_class:
             self._attr_device_class = device_class
-        if state_class := definition.get("ha_state_class"):
+        if state_class := definition.ha_state_class:
             self._attr_state_class = state_class
-        if unit := definition.get("ha_native_unit_of_measurement"):
+        if unit := definition.ha_native_unit_of_measurement:
             self._attr_native_unit_of_measurement = unit
-        if category := definition.get("entity_category"):
+        if category := definition.entity_category:
             self._attr_entity_category = category
-        if (enabled := definition.get("entity_registry_enabled_default")) is not None:
-            self._attr_entity_registry_enabled_default = enabled
+        self._attr_entity_registry_enabled_default = (
+            definition.entity_registry_enabled_default
+        )
+        # Definitions are frozen, so the suffix can be resolved once here
+        # instead of on every unique_id read.
+        self._unique_id_suffix = definition.unique_id_suffix or definition.key
 
     def _get_unique_id_suffix(self) -> str:
         """Return the unique ID suffix (legacy compatibility)."""
-        return self._definition.get("unique_id_suffix") or self._definition["key"]
+        return self._unique_id_suffix
 
 
 class TadoGenericEntityMixin(TadoDefinitionMixin):
@@ -50,33 +54,33 @@ class TadoGenericEntityMixin(TadoDefinitionMixin):
     coordinator: TadoDataUpdateCoordinator
     _tado_entity_id: Any
 
+    def __init__(self, definition: TadoEntityDefinition) -> None:
+        """Initialize the generic entity mixin.
+
+        The value_fn argument tuple is fixed by scope (coordinator plus an
+        optional context ID), so it is built once here instead of per call.
+        """
+        TadoDefinitionMixin.__init__(self, definition)
+        ctx_id = self._tado_entity_id
+        self._value_args: tuple[Any, ...] = (
+            (self.coordinator,) if ctx_id is None else (self.coordinator, ctx_id)
+        )
+
     def _get_actual_value(self) -> Any:
         """Get actual value via value_fn."""
-        args: list[Any] = [self.coordinator]
-        if (ctx_id := self._tado_entity_id) is not None:
-            args.append(ctx_id)
-
-        return self._definition["value_fn"](*args)
+        return self._definition.value_fn(*self._value_args)
 
     async def _async_press(self) -> None:
         """Handle button press via press_fn."""
-        if press_fn := self._definition.get("press_fn"):
-            args: list[Any] = [self.coordinator]
-            if (ctx_id := self._tado_entity_id) is not None:
-                args.append(ctx_id)
-
-            result = press_fn(*args)
+        if press_fn := self._definition.press_fn:
+            result = press_fn(*self._value_args)
             if asyncio.iscoroutine(result):
                 await result
 
     async def _async_select_option(self, option: str) -> None:
         """Handle select option via select_option_fn."""
-        if select_fn := self._definition.get("select_option_fn"):
-            args: list[Any] = [self.coordinator]
-            if (ctx_id := self._tado_entity_id) is not None:
-                args.append(ctx_id)
-            args.append(option)
-            await select_fn(*args)
+        if select_fn := self._definition.select_option_fn:
+            await select_fn(*self._value_args, option)
 
     @property
     def native_value(self) -> Any:
@@ -173,6 +177,54 @@ class TadoStateMemoryMixin(RestoreEntity):
         return attrs
 
 
+def _build_home_device_info(coordinator: TadoDataUpdateCoordinator) -> DeviceInfo:
+    """Build device info for the home device."""
+    if coordinator.config_entry is None:
+        raise RuntimeError("Config entry not available")
+
+    # Use Home ID (unique_id) as identifier for consistent grouping
+    identifiers = {
+        (
+            DOMAIN,
+            coordinator.config_entry.unique_id or coordinator.entry_id,
+        )
+    }
+
+    name = coordinator.config_entry.title
+    model = "Internet Bridge" if coordinator.generation != GEN_X else "Tado Home"
+    sw_version = None
+    serial_number = None
+
+    # Link to Bridges if found
+    for bridge in coordinator.bridges:
+        identifiers.add((DOMAIN, bridge.serial_no))
+        # Link external devices (HomeKit/Matter) - skip if full_cloud_mode
+        if not coordinator.full_cloud_mode:
+            if linked_ids := get_linked_device_identifiers(
+                coordinator.hass, bridge.serial_no, coordinator.generation
+            ):
+                identifiers.update(linked_ids)
+
+        # Use first bridge for metadata
+        if sw_version is None:
+            # In Classic mode, we follow OG style if a bridge is found
+            if coordinator.generation != GEN_X:
+                name = f"tado Internet Bridge {bridge.serial_no}"
+
+            model = bridge.device_type
+            sw_version = bridge.current_fw_version
+            serial_number = bridge.serial_no
+    return DeviceInfo(
+        identifiers=identifiers,
+        name=name,
+        manufacturer="Tado",
+        model=model,
+        sw_version=sw_version,
+        serial_number=serial_number,
+        configuration_url="https://app.tado.com",
+    )
+
+
 class TadoEntity(CoordinatorEntity):
     """Base class for Tado Hijack entities."""
 
@@ -189,6 +241,9 @@ class TadoEntity(CoordinatorEntity):
     ) -> None:
         """Initialize Tado entity."""
         super().__init__(coordinator)
+        # Typed alias for self.coordinator; a plain attribute load instead
+        # of a property call on every access.
+        self.tado_coordinator: TadoDataUpdateCoordinator = coordinator
         self._attr_translation_key = translation_key
 
     def _set_entity_id(
@@ -234,11 +289,6 @@ class TadoEntity(CoordinatorEntity):
 
         self.entity_id = f"{domain}.{prefix}_{home_slug}{suffix}"
 
-    @property
-    def tado_coordinator(self) -> TadoDataUpdateCoordinator:
-        """Return the coordinator."""
-        return cast("TadoDataUpdateCoordinator", self.coordinator)
-
     @property
     def unique_id(self) -> str | None:
         """Return a unique ID for the entity."""
@@ -250,10 +300,10 @@ class TadoEntity(CoordinatorEntity):
             return cast(str | None, self._attr_unique_id)
 
         suffix = self._get_unique_id_suffix()
-        scope = self._definition.get("scope")
+        scope = self._definition.scope
 
         # Handle Legacy Formats (No Config Entry ID prefix)
-        if self._definition.get("use_legacy_unique_id_format"):
+        if self._definition.use_legacy_unique_id_format:
             if scope == "zone":
                 return f"zone_{self._zone_id}_{suffix}"
             if scope == "device":
@@ -262,7 +312,7 @@ class TadoEntity(CoordinatorEntity):
                 return f"bridge_{self._serial_no}_{suffix}"
 
         # Default Modern Format: {ENTRY_ID}_{SUFFIX}[_{CONTEXT_ID}]
-        uid = f"{self.coordinator.config_entry.entry_id}_{suffix}"
+        uid = f"{self.coordinator.entry_id}_{suffix}"
         if scope == "zone":
             uid += f"_{self._zone_id}"
         elif scope in ("device", "bridge"):
@@ -279,56 +329,16 @@ class TadoEntity(CoordinatorEntity):
 class TadoHomeEntity(TadoEntity):
     """Entity belonging to the Tado Home device."""
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the home."""
-        if self.coordinator.config_entry is None:
-            raise RuntimeError("Config entry not available")
-
-        # Use Home ID (unique_id) as identifier for consistent grouping
-        identifiers = {
-            (
-                DOMAIN,
-                self.coordinator.config_entry.unique_id
-                or self.coordinator.config_entry.entry_id,
-            )
-        }
-
-        name = self.coordinator.config_entry.title
-        model = (
-            "Internet Bridge" if self.coordinator.generation != GEN_X else "Tado Home"
-        )
-        sw_version = None
-        serial_number = None
-
-        # Link to Bridges if found
-        for bridge in self.coordinator.bridges:
-            identifiers.add((DOMAIN, bridge.serial_no))
-            # Link external devices (HomeKit/Matter) - skip if full_cloud_mode
-            if not self.coordinator.full_cloud_mode:
-                if linked_ids := get_linked_device_identifiers(
-                    self.coordinator.hass, bridge.serial_no, self.coordinator.generation
-                ):
-                    identifiers.update(linked_ids)
-
-            # Use first bridge for metadata
-            if sw_version is None:
-                # In Classic mode, we follow OG style if a bridge is found
-                if self.coordinator.generation != GEN_X:
-                    name = f"tado Internet Bridge {bridge.serial_no}"
-
-                model = bridge.device_type
-                sw_version = bridge.current_fw_version
-                serial_number = bridge.serial_no
-        return DeviceInfo(
-            identifiers=identifiers,
-            name=name,
-            manufacturer="Tado",
-            model=model,
-            sw_version=sw_version,
-            serial_number=serial_number,
-            configuration_url="https://app.tado.com",
-        )
+    def __init__(
+        self,
+        coordinator: TadoDataUpdateCoordinator,
+        translation_key: str | None,
+    ) -> None:
+        """Initialize Tado home entity."""
+        super().__init__(coordinator, translation_key)
+        # Entities are created after the first refresh, so bridges are
+        # known; build the device info once instead of per property read.
+        self._attr_device_info = _build_home_device_info(coordinator)
 
 
 class TadoBridgeEntity(TadoHomeEntity):
@@ -367,34 +377,31 @@ class TadoZoneEntity(TadoEntity):
         """Initialize Tado zone entity."""
         super().__init__(coordinator, translation_key)
         self._zone_id = zone_id
+        # zone_states is keyed by string; cache the coercion once per entity.
+        self._zone_id_str = str(zone_id)
         self._zone_name = zone_name
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the zone."""
-        if self.coordinator.config_entry is None:
+        if coordinator.config_entry is None:
             raise RuntimeError("Config entry not available")
 
-        from .const import GEN_X
-
-        if self.tado_coordinator.generation == GEN_X:
+        if coordinator.generation == GEN_X:
             model = "Heating Zone"
         else:
-            zone = self.tado_coordinator.zones_meta.get(self._zone_id)
+            zone = coordinator.zones_meta.get(zone_id)
             model = (
                 "Hot Water Zone"
                 if zone and zone.type == ZONE_TYPE_HOT_WATER
                 else "Heating Zone"
             )
 
-        return DeviceInfo(
+        self._attr_device_info = DeviceInfo(
             identifiers={
                 (
                     DOMAIN,
-                    f"{self.coordinator.config_entry.entry_id}_zone_{self._zone_id}",
+                    f"{coordinator.entry_id}_zone_{zone_id}",
                 )
             },
-            name=self._zone_name,
+            name=zone_name,
             manufacturer="Tado",
             model=model,
         )
@@ -418,22 +425,20 @@ class TadoHotWaterZoneEntity(TadoEntity):
         """Initialize Tado hot water zone entity."""
         super().__init__(coordinator, translation_key)
         self._zone_id = zone_id
+        self._zone_id_str = str(zone_id)
         self._zone_name = zone_name
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the hot water zone."""
-        if self.coordinator.config_entry is None:
+        if coordinator.config_entry is None:
             raise RuntimeError("Config entry not available")
         # Use zone name directly - Tado typically names it "Hot Water" already
-        return DeviceInfo(
+        self._attr_device_info = DeviceInfo(
             identifiers={
                 (
                     DOMAIN,
-                    f"{self.coordinator.config_entry.entry_id}_zone_{self._zone_id}",
+                    f"{coordinator.entry_id}_zone_{zone_id}",
                 )
             },
-            name=self._zone_name,
+            name=zone_name,
             manufacturer="Tado",
             model="Hot Water Zone",
         )
@@ -468,26 +473,23 @@ class TadoDeviceEntity(TadoEntity):
         else:
             self._linked_identifiers = set()
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info for the physical device."""
-        identifiers = {(DOMAIN, self._serial_no)}
+        identifiers = {(DOMAIN, serial_no)}
         if self._linked_identifiers:
             identifiers.update(self._linked_identifiers)
 
-        model_name = DEVICE_TYPE_MAP.get(self._device_type, self._device_type)
+        model_name = DEVICE_TYPE_MAP.get(device_type, device_type)
 
-        return DeviceInfo(
+        self._attr_device_info = DeviceInfo(
             identifiers=identifiers,
-            name=f"tado {model_name} {self._short_serial}",
+            name=f"tado {model_name} {short_serial}",
             manufacturer="Tado",
             model=model_name,
             via_device=(
                 DOMAIN,
-                f"{self.coordinator.config_entry.entry_id}_zone_{self._zone_id}",
+                f"{coordinator.entry_id}_zone_{zone_id}",
             ),
-            sw_version=self._fw_version,
-            serial_number=self._serial_no,
+            sw_version=fw_version,
+            serial_number=serial_no,
         )
 
     @property
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import orjson
 from tadoasync import Tado
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
 from tadoasync.const import HttpMethod
 from tadoasync.tadoasync import API_URL
 
@@ -21,12 +24,18 @@ class TadoHijackClient(Tado):
     def __init__(
         self,
         *args: Any,
+        session: ClientSession,
         proxy_url: str | None = None,
         proxy_token: str | None = None,
         **kwargs: Any,
     ) -> None:
-        """Initialize the client with optional proxy URL and token."""
-        super().__init__(*args, **kwargs)
+        """Initialize the client with a shared session and optional proxy.
+
+        The session is required so every request (including token refresh
+        and the proxy path) reuses HA's pooled connections instead of
+        tadoasync silently spinning up its own ClientSession.
+        """
+        super().__init__(*args, session=session, **kwargs)
         self.proxy_url = proxy_url
         self.proxy_token = proxy_token
 
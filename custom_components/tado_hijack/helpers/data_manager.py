@@ -21,9 +21,12 @@ from ..const import (
     DEFAULT_PRESENCE_POLL_INTERVAL,
     GEN_X,
     SLOW_POLL_CYCLE_S,
+    ZONE_TYPE_HEATING,
 )
 from ..models import TadoData
 from .logging_utils import get_redacted_logger
+from .parsers import clear_ac_capabilities_cache
+from .zone_utils import get_zone_type
 
 _LOGGER = get_redacted_logger(__name__)
 
@@ -60,6 +63,11 @@ class TadoDataManager:
         # Caches
         self.zones_meta: dict[int, Any] = {}
         self.devices_meta: dict[str, Any] = {}
+        # Stable value snapshots, rebuilt only when metadata refreshes.
+        # Iterating consumers get a fixed object between slow polls.
+        self.zones_cached: tuple[Any, ...] = ()
+        self.devices_cached: tuple[Any, ...] = ()
+        self.heating_zones_cached: tuple[Any, ...] = ()
         self.capabilities_cache: dict[int, Any] = {}
         self.offsets_cache: dict[str, TemperatureOffset] = {}
         self.away_cache: dict[int, float] = {}
@@ -182,7 +190,7 @@ class TadoDataManager:
         """Count v3 zones with special polling needs (AC/HOT_WATER)."""
         return sum(
             z.type in ("AIR_CONDITIONING", "HOT_WATER")
-            for z in self.zones_meta.values()
+            for z in self.zones_cached
         )
 
     def _count_special_zones_tadox(self) -> int:
@@ -205,7 +213,7 @@ class TadoDataManager:
             and not self._is_entity_disabled(
                 "number", f"{d.serial_no}_temperature_offset"
             )
-            for d in self.devices_meta.values()
+            for d in self.devices_cached
         )
 
         breakdown = {
@@ -236,21 +244,32 @@ class TadoDataManager:
         home_state = getattr(self.coordinator.data, "home_state", None)
         zone_states = getattr(self.coordinator.data, "zone_states", {})
 
-        for task in plan:
+        # The tracks hit independent endpoints, so run them concurrently:
+        # cycle latency is bounded by the slowest call instead of the sum.
+        # gather() keeps default error propagation, matching the previous
+        # sequential behaviour of surfacing the first failure.
+        results = await asyncio.gather(
+            *(
+                task.coroutine(now)
+                if task.coroutine
+                in (self._fetch_zones, self._fetch_presence, self._fetch_metadata)
+                else task.coroutine()
+                for task in plan
+            )
+        )
+
+        for task, result in zip(plan, results, strict=True):
             if task.coroutine == self._fetch_zones:
-                zone_states = await task.coroutine(now)
+                zone_states = result
             elif task.coroutine == self._fetch_presence:
-                home_state = await task.coroutine(now)
+                home_state = result
             elif task.coroutine == self._fetch_metadata:
-                await task.coroutine(now)
                 # For Tado X, presence might have been updated during metadata fetch
                 if self.coordinator.generation == GEN_X and self.coordinator.data:
                     home_state = self.coordinator.data.home_state
             elif task.coroutine == self._fetch_away_config:
-                await task.coroutine()
                 self._last_away_poll = now
             elif task.coroutine == self._fetch_offsets:
-                await task.coroutine()
                 self._last_offset_poll = now
 
         if self.coordinator.generation != GEN_X:
@@ -357,7 +376,21 @@ class TadoDataManager:
         if not self.provider:
             return
 
-        zones, devices = await self.provider.async_fetch_metadata()
+        # Stale-while-revalidate: on a failed refresh keep serving the
+        # cached metadata and retry on the next cycle instead of failing
+        # the whole update.
+        try:
+            zones, devices = await self.provider.async_fetch_metadata()
+        except TadoConnectionError as e:
+            if self._metadata_init:
+                _LOGGER.warning(
+                    "Metadata refresh failed (%s); keeping cached metadata", e
+                )
+                return
+            raise
+        if not zones and self._metadata_init:
+            _LOGGER.warning("Metadata refresh returned no zones; keeping cache")
+            return
 
         # Sync with optimistic manager to prevent UI jumps (Open Window)
         for zid, z in zones.items():
@@ -372,6 +405,13 @@ class TadoDataManager:
                 self.zones_meta, self.devices_meta, self.capabilities_cache
             )
 
+        # Snapshot after the dummy hook so injected entries are included
+        self.zones_cached = tuple(self.zones_meta.values())
+        self.devices_cached = tuple(self.devices_meta.values())
+        self.heating_zones_cached = tuple(
+            z for z in self.zones_cached if get_zone_type(z, "") == ZONE_TYPE_HEATING
+        )
+
         # Lazy refresh for capabilities (V3 only)
         if self.coordinator.generation != GEN_X:
             for z in zones.values():
@@ -427,6 +467,8 @@ class TadoDataManager:
             caps = await self.provider.async_fetch_capabilities(zone_id)
             if caps:
                 self.capabilities_cache[zone_id] = caps
+                # Drop memoized AC options parsed from the replaced object
+                clear_ac_capabilities_cache()
         except Exception as e:
             _LOGGER.warning(
                 "Capabilities unavailable for zone %d (%s) — skipping",
@@ -467,6 +509,8 @@ class TadoDataManager:
         if refresh_type in {"all", "zone"}:
             self._zones_invalidated_at = now
             self._zones_init = False
+        if refresh_type in {"all", "metadata", "zone"}:
+            clear_ac_capabilities_cache()
 
     def _is_entity_disabled(self, platform: str, unique_id: str) -> bool:
         """Check if an entity is disabled."""
@@ -481,7 +525,7 @@ class TadoDataManager:
 
         active = [
             d
-            for d in self.devices_meta.values()
+            for d in self.devices_cached
             if CAPABILITY_INSIDE_TEMP in (d.characteristics.capabilities or [])
             and not self._is_entity_disabled(
                 "number", f"{d.serial_no}_temperature_offset"
@@ -523,14 +567,10 @@ class TadoDataManager:
         if not self.provider or self.coordinator.generation == GEN_X:
             return
 
-        from .zone_utils import get_zone_type
-        from ..const import ZONE_TYPE_HEATING
-
         active = [
             z
-            for z in self.zones_meta.values()
-            if get_zone_type(z, "") == ZONE_TYPE_HEATING
-            and not self._is_entity_disabled("number", f"zone_{z.id}_away_temperature")
+            for z in self.heating_zones_cached
+            if not self._is_entity_disabled("number", f"zone_{z.id}_away_temperature")
         ]
         if not active:
             return
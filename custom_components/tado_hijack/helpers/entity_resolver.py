@@ -52,7 +52,7 @@ class EntityResolver:
         target_base = self._get_entity_base_name(target_name)
 
         for entity_entry in er.async_entries_for_config_entry(
-            ent_reg, self.coordinator.config_entry.entry_id
+            ent_reg, self.coordinator.entry_id
         ):
             if (zid := self.parse_unique_id(entity_entry.unique_id)) is not None:
                 self._cache[entity_entry.entity_id] = zid
@@ -124,7 +124,7 @@ class EntityResolver:
             return False
 
         ent_reg = er.async_get(self.hass)
-        unique_id = f"{self.coordinator.config_entry.entry_id}_sch_{zone_id}"
+        unique_id = f"{self.coordinator.entry_id}_sch_{zone_id}"
         if entity_id := ent_reg.async_get_entity_id("switch", DOMAIN, unique_id):
             entry = ent_reg.async_get(entity_id)
             if entry and entry.disabled:
@@ -12,11 +12,12 @@ from ..const import (
     ZONE_TYPE_HEATING,
     ZONE_TYPE_HOT_WATER,
 )
-from ..definitions import ENTITY_DEFINITIONS
 from .discovery import yield_devices, yield_zones
 from .logging_utils import get_redacted_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from .. import TadoConfigEntry
     from ..coordinator import TadoDataUpdateCoordinator
     from ..models import TadoEntityDefinition
@@ -24,15 +25,19 @@ if TYPE_CHECKING:
 _LOGGER = get_redacted_logger(__name__)
 
 # Default supported zone types if not specified
-ALL_ZONE_TYPES = {
-    ZONE_TYPE_HEATING,
-    ZONE_TYPE_AIR_CONDITIONING,
-    ZONE_TYPE_HOT_WATER,
-}
+ALL_ZONE_TYPES = frozenset(
+    {
+        ZONE_TYPE_HEATING,
+        ZONE_TYPE_AIR_CONDITIONING,
+        ZONE_TYPE_HOT_WATER,
+    }
+)
 
 # Zone types not yet supported on Tado X - entities limited to these are skipped.
 # Remove a type from this set once it is implemented for Tado X.
-_TADOX_UNSUPPORTED_ZONE_TYPES = {ZONE_TYPE_HOT_WATER, ZONE_TYPE_AIR_CONDITIONING}
+_TADOX_UNSUPPORTED_ZONE_TYPES = frozenset(
+    {ZONE_TYPE_HOT_WATER, ZONE_TYPE_AIR_CONDITIONING}
+)
 
 
 async def async_setup_generic_platform(
@@ -43,31 +48,26 @@ async def async_setup_generic_platform(
     entity_classes: dict[str, Any],  # scope -> class
 ) -> None:
     """Set up generic Tado entities for a specific platform."""
+    # Imported lazily so the definition table is only built once a platform
+    # actually loads (PEP 562 hook in definitions.py).
+    from ..definitions import definitions_for_platform
+
     coordinator: TadoDataUpdateCoordinator = entry.runtime_data
     entities: list[Any] = []
 
-    for d in ENTITY_DEFINITIONS:
-        if d["platform"] != platform:
-            continue
-
+    for d in definitions_for_platform(platform):
         if (
-            gens := d.get("supported_generations")
+            gens := d.supported_generations
         ) and coordinator.generation not in gens:
             continue
 
-        scope = d["scope"]
+        scope = d.scope
         cls = entity_classes.get(scope)
         if not cls:
             continue
 
-        if scope == "home":
-            _process_home_scope(coordinator, d, cls, entities)
-        elif scope == "zone":
-            _process_zone_scope(coordinator, d, cls, entities)
-        elif scope == "device":
-            _process_device_scope(coordinator, d, cls, entities)
-        elif scope == "bridge":
-            _process_bridge_scope(coordinator, d, cls, entities)
+        if processor := _SCOPE_PROCESSORS.get(scope):
+            entities.extend(processor(coordinator, d, cls))
 
     if entities:
         _LOGGER.debug(
@@ -82,100 +82,99 @@ def _process_home_scope(
     coordinator: TadoDataUpdateCoordinator,
     definition: TadoEntityDefinition,
     cls: Any,
-    entities: list[Any],
-) -> None:
-    """Process entities with Home scope."""
-    if (is_supported := definition.get("is_supported_fn")) and not is_supported(
+) -> Iterator[Any]:
+    """Yield entities with Home scope."""
+    if (is_supported := definition.is_supported_fn) and not is_supported(
         coordinator
     ):
         return
-    entities.append(cls(coordinator, definition))
+    yield cls(coordinator, definition)
 
 
 def _process_zone_scope(
     coordinator: TadoDataUpdateCoordinator,
     definition: TadoEntityDefinition,
     cls: Any,
-    entities: list[Any],
-) -> None:
-    """Process entities with Zone scope - generation-aware dispatcher."""
+) -> Iterator[Any]:
+    """Yield entities with Zone scope - generation-aware dispatcher."""
     from ..const import GEN_X
 
     if coordinator.generation == GEN_X:
-        _process_zone_scope_tadox(coordinator, definition, cls, entities)
-    else:
-        _process_zone_scope_v3(coordinator, definition, cls, entities)
+        return _process_zone_scope_tadox(coordinator, definition, cls)
+    return _process_zone_scope_v3(coordinator, definition, cls)
 
 
 def _process_zone_scope_v3(
     coordinator: TadoDataUpdateCoordinator,
     definition: TadoEntityDefinition,
     cls: Any,
-    entities: list[Any],
-) -> None:
-    """Process zone entities for v3 Classic (filtered by zone type, uses zone.id/zone.name)."""
-    supported_types = definition.get("supported_zone_types") or ALL_ZONE_TYPES
+) -> Iterator[Any]:
+    """Yield zone entities for v3 Classic (filtered by zone type, uses zone.id/zone.name)."""
+    supported_types = definition.supported_zone_types or ALL_ZONE_TYPES
+    is_supported = definition.is_supported_fn
     for zone in yield_zones(coordinator, supported_types):
-        if (is_supported := definition.get("is_supported_fn")) and not is_supported(
-            coordinator, zone.id
-        ):
+        if is_supported and not is_supported(coordinator, zone.id):
             continue
-        entities.append(cls(coordinator, definition, zone.id, zone.name))
+        yield cls(coordinator, definition, zone.id, zone.name)
 
 
 def _process_zone_scope_tadox(
     coordinator: TadoDataUpdateCoordinator,
     definition: TadoEntityDefinition,
     cls: Any,
-    entities: list[Any],
-) -> None:
-    """Process zone entities for Tado X (all rooms, uses room.room_id/room.room_name).
+) -> Iterator[Any]:
+    """Yield zone entities for Tado X (all rooms, uses room.room_id/room.room_name).
 
     Entities limited to HOT_WATER or AIR_CONDITIONING zone types are skipped
     until those zone types are implemented for Tado X.
     """
-    supported_types = definition.get("supported_zone_types")
+    supported_types = definition.supported_zone_types
     if supported_types and supported_types.issubset(_TADOX_UNSUPPORTED_ZONE_TYPES):
         # Not yet implemented for Tado X (e.g. HOT_WATER-only, AC-only).
         return
 
+    is_supported = definition.is_supported_fn
     for room in yield_zones(coordinator):
-        if (is_supported := definition.get("is_supported_fn")) and not is_supported(
-            coordinator, room.room_id
-        ):
+        if is_supported and not is_supported(coordinator, room.room_id):
             continue
-        entities.append(cls(coordinator, definition, room.room_id, room.room_name))
+        yield cls(coordinator, definition, room.room_id, room.room_name)
 
 
 def _process_device_scope(
     coordinator: TadoDataUpdateCoordinator,
     definition: TadoEntityDefinition,
     cls: Any,
-    entities: list[Any],
-) -> None:
-    """Process entities with Device scope."""
-    required_caps = definition.get("required_device_capabilities")
-    caps_args = required_caps or []
+) -> Iterator[Any]:
+    """Yield entities with Device scope."""
+    required_caps = definition.required_device_capabilities
+    capability = required_caps[0] if required_caps else None
 
     # Process devices across all zone types
-    for device, zone_id in yield_devices(coordinator, ALL_ZONE_TYPES, *caps_args):
-        if (is_supported := definition.get("is_supported_fn")) and not is_supported(
-            coordinator, device.serial_no
-        ):
+    is_supported = definition.is_supported_fn
+    for device, zone_id in yield_devices(coordinator, ALL_ZONE_TYPES, capability):
+        if is_supported and not is_supported(coordinator, device.serial_no):
             continue
-        entities.append(cls(coordinator, definition, device, zone_id))
+        yield cls(coordinator, definition, device, zone_id)
 
 
 def _process_bridge_scope(
     coordinator: TadoDataUpdateCoordinator,
     definition: TadoEntityDefinition,
     cls: Any,
-    entities: list[Any],
-) -> None:
-    """Process entities with Bridge scope."""
+) -> Iterator[Any]:
+    """Yield entities with Bridge scope."""
+    is_supported = definition.is_supported_fn
     for bridge in coordinator.bridges:
-        if (is_supported := definition.get("is_supported_fn")) and not is_supported(
-            coordinator, bridge.serial_no
-        ):
+        if is_supported and not is_supported(coordinator, bridge.serial_no):
             continue
-        entities.append(cls(coordinator, definition, bridge))
+        yield cls(coordinator, definition, bridge)
+
+
+# Scope -> processor dispatch table (avoids re-walking an if/elif chain
+# for every definition during platform setup).
+_SCOPE_PROCESSORS = {
+    "home": _process_home_scope,
+    "zone": _process_zone_scope,
+    "device": _process_device_scope,
+    "bridge": _process_bridge_scope,
+}
@@ -7,55 +7,48 @@ from typing import Any, cast
 
 from ..const import OPTIMISTIC_GRACE_PERIOD_S
 
+# Pre-bound to skip the module attribute lookup on every read/write.
+_monotonic = time.monotonic
+
 
 class OptimisticManager:
     """Manages temporary optimistic states for immediate UI feedback."""
 
+    __slots__ = ("_store",)
+
     def __init__(self) -> None:
         """Initialize the manager."""
-        # Generic store: {scope: {id: {key: (value, time)}}}
-        self._store: dict[str, dict[str | int, dict[str, tuple[Any, float]]]] = {
-            "home": {},
-            "zone": {},
-            "device": {},
-        }
+        # Flat store keyed by (scope, id, key): a single hash probe per
+        # access and no nested dict allocations per touched entity.
+        # Values carry the expiry deadline, so reads are a single compare.
+        self._store: dict[tuple[str, str | int, str], tuple[Any, float]] = {}
 
     def set_optimistic(
         self, scope: str, entity_id: str | int, key: str, value: Any
     ) -> None:
         """Set an optimistic value for a given scope, ID and key."""
-        if scope not in self._store:
-            self._store[scope] = {}
-        if entity_id not in self._store[scope]:
-            self._store[scope][entity_id] = {}
-
-        self._store[scope][entity_id][key] = (value, time.monotonic())
+        self._store[(scope, entity_id, key)] = (
+            value,
+            _monotonic() + OPTIMISTIC_GRACE_PERIOD_S,
+        )
 
     def get_optimistic(self, scope: str, entity_id: str | int, key: str) -> Any | None:
         """Return optimistic value if not expired."""
-        if (
-            scope not in self._store
-            or entity_id not in self._store[scope]
-            or key not in self._store[scope][entity_id]
-        ):
+        entry = self._store.get((scope, entity_id, key))
+        if entry is None:
             return None
 
-        val, set_time = self._store[scope][entity_id][key]
-        if (time.monotonic() - set_time) < OPTIMISTIC_GRACE_PERIOD_S:
+        val, expires_at = entry
+        if _monotonic() < expires_at:
             return val
 
         # Clean up expired entry
-        del self._store[scope][entity_id][key]
+        del self._store[(scope, entity_id, key)]
         return None
 
     def clear_optimistic(self, scope: str, entity_id: str | int, key: str) -> None:
         """Clear a specific optimistic value (e.g. for rollback)."""
-        if (
-            scope in self._store
-            and entity_id in self._store[scope]
-            and key in self._store[scope][entity_id]
-        ):
-            del self._store[scope][entity_id][key]
+        self._store.pop((scope, entity_id, key), None)
 
     def set_presence(self, presence: str) -> None:
         """Set optimistic presence state."""
@@ -248,8 +241,10 @@ class OptimisticManager:
 
     def clear_zone(self, zone_id: int) -> None:
         """Clear optimistic zone state (for rollback)."""
-        if "zone" in self._store and zone_id in self._store["zone"]:
-            del self._store["zone"][zone_id]
+        for entry_key in [
+            k for k in self._store if k[0] == "zone" and k[1] == zone_id
+        ]:
+            del self._store[entry_key]
 
     def clear_child_lock(self, serial_no: str) -> None:
         """Clear optimistic child lock state (for rollback)."""
@@ -275,15 +270,13 @@ class OptimisticManager:
         """Clear optimistic open window (for rollback)."""
         self.clear_optimistic("zone", zone_id, "open_window")
 
-    def cleanup(self) -> None:
-        """Clear expired optimistic states."""
-        now = time.monotonic()
-        for scope in self._store:
-            for entity_id in list(self._store[scope].keys()):
-                for key in list(self._store[scope][entity_id].keys()):
-                    _, set_time = self._store[scope][entity_id][key]
-                    if (now - set_time) > OPTIMISTIC_GRACE_PERIOD_S:
-                        del self._store[scope][entity_id][key]
-                # Cleanup empty ID dicts
-                if not self._store[scope][entity_id]:
-                    del self._store[scope][entity_id]
+    def cleanup(self, now: float | None = None) -> None:
+        """Clear expired optimistic states.
+
+        The store is only rebuilt when something actually expired, so the
+        common no-op cleanup cycle is a pure read pass. Callers that
+        already hold a monotonic snapshot can pass it as ``now``.
+        """
+        cutoff = now if now is not None else _monotonic()
+        if any(expires_at <= cutoff for _, expires_at in self._store.values()):
+            self._store = {k: v for k, v in self._store.items() if v[1] > cutoff}
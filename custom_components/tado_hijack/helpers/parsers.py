@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 from ..models import RateLimit
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from tadoasync.models import Capabilities
 
 
@@ -15,18 +17,22 @@ _QUOTA_REGEX = re.compile(r"q=(\d+)")
 _REMAINING_REGEX = re.compile(r"r=(\d+)")
 
 
-def parse_ratelimit_headers(headers: dict[str, Any]) -> RateLimit | None:
-    """Extract RateLimit information from Tado API headers."""
+def _extract(pattern: re.Pattern[str], value: str) -> int | None:
+    match = pattern.search(value)
+    return int(match[1]) if match else None
+
 
-    def extract(pattern: re.Pattern[str], value: str) -> int | None:
-        match = pattern.search(value)
-        return int(match[1]) if match else None
+def parse_ratelimit_headers(headers: Mapping[str, Any]) -> RateLimit | None:
+    """Extract RateLimit information from Tado API headers.
 
+    Accepts any mapping with .get(), including aiohttp's CIMultiDictProxy,
+    so callers don't need to copy response headers into a dict.
+    """
     policy = headers.get("RateLimit-Policy", "")
     rl = headers.get("RateLimit", "")
 
-    limit = extract(_QUOTA_REGEX, policy)
-    remaining = extract(_REMAINING_REGEX, rl)
+    limit = _extract(_QUOTA_REGEX, policy)
+    remaining = _extract(_REMAINING_REGEX, rl)
 
     if limit is not None or remaining is not None:
         return RateLimit(limit=limit or 0, remaining=remaining or 0)
@@ -60,6 +66,26 @@ def get_ac_capabilities(capabilities: Capabilities) -> dict[str, set[str]]:
     }
 
 
+# Parsed AC options keyed by id() of the Capabilities object. The three AC
+# selects per zone all parse the same cached object every refresh; entries
+# are cleared whenever the capabilities cache itself is refreshed.
+_AC_CAPS_CACHE: dict[int, dict[str, set[str]]] = {}
+
+
+def cached_ac_capabilities(capabilities: Capabilities) -> dict[str, set[str]]:
+    """Return get_ac_capabilities() output, memoized per capabilities object."""
+    if (cached := _AC_CAPS_CACHE.get(id(capabilities))) is not None:
+        return cached
+    result = get_ac_capabilities(capabilities)
+    _AC_CAPS_CACHE[id(capabilities)] = result
+    return result
+
+
+def clear_ac_capabilities_cache() -> None:
+    """Drop memoized AC options (call when capabilities are refetched)."""
+    _AC_CAPS_CACHE.clear()
+
+
 def parse_schedule_temperature(state: Any) -> float | None:
     """Extract the target temperature from the active schedule in zone state.
 
@@ -24,6 +24,12 @@ from .parsers import parse_ratelimit_headers
 
 _LOGGER = get_redacted_logger(__name__)
 
+# Built once: every non-proxy request starts from one of these two bases
+# and from the same User-Agent header set.
+_BASE_URL_TADO = URL.build(scheme="https", host=TADO_HOST_URL, path=TADO_API_PATH)
+_BASE_URL_EIQ = URL.build(scheme="https", host=EIQ_HOST_URL, path=EIQ_API_PATH)
+_BASE_HEADERS = {"User-Agent": TADO_USER_AGENT}
+
 
 class TadoRequestHandler:
     """Handles Tado API requests with browser-like behavior and rate limit tracking."""
@@ -162,7 +168,7 @@ class TadoRequestHandler:
 
     def _log_response(self, response: Any, url: Any) -> None:
         """Log response with rate limit info if available."""
-        if rl := parse_ratelimit_headers(dict(response.headers)):
+        if rl := parse_ratelimit_headers(response.headers):
             self.rate_limit_data["limit"] = rl.limit
             self.rate_limit_data["remaining"] = rl.remaining
             _LOGGER.debug(
@@ -207,9 +213,9 @@ class TadoRequestHandler:
                     url = parsed_proxy.with_path(f"{base_path}{TADO_API_PATH}")
 
         elif endpoint == EIQ_HOST_URL:
-            url = URL.build(scheme="https", host=EIQ_HOST_URL, path=EIQ_API_PATH)
+            url = _BASE_URL_EIQ
         else:
-            url = URL.build(scheme="https", host=TADO_HOST_URL, path=TADO_API_PATH)
+            url = _BASE_URL_TADO
 
         if uri:
             # yarl.joinpath encodes '?' which breaks Tado's query parsing.
@@ -224,9 +230,7 @@ class TadoRequestHandler:
         self, access_token: str | None, method: HttpMethod, is_proxy: bool = False
     ) -> dict[str, str]:
         """Build headers matching browser behavior."""
-        headers = {
-            "User-Agent": TADO_USER_AGENT,
-        }
+        headers = _BASE_HEADERS.copy()
 
         # Only add Authorization header when NOT using proxy (proxy handles auth)
         if not is_proxy and access_token:
@@ -11,6 +11,7 @@ from ..discovery import yield_zones
 from ..logging_utils import get_redacted_logger
 from ..overlay_builder import build_overlay_data
 from ..state_patcher import patch_zone_overlay, patch_zone_resume
+from ..zone_utils import zone_key
 
 if TYPE_CHECKING:
     from ...coordinator import TadoDataUpdateCoordinator
@@ -40,23 +41,29 @@ class TadoV3ActionProvider(TadoActionProvider):
             "Queued resume schedules for %d active heating zones", len(active_zones)
         )
 
+        # Queue everything first, then notify listeners exactly once so the
+        # UI fanout stays O(listeners) instead of O(zones * listeners).
         for zone_id in active_zones:
-            old_state = patch_zone_resume(
-                self.coordinator.data.zone_states.get(str(zone_id))
-            )
+            self._queue_zone_resume(zone_id)
 
-            self.coordinator.optimistic.set_zone(zone_id, False)
+        self.coordinator.async_update_listeners()
 
-            self.coordinator.api_manager.queue_command(
-                f"zone_{zone_id}",
-                TadoCommand(
-                    CommandType.RESUME_SCHEDULE,
-                    zone_id=zone_id,
-                    rollback_context=old_state,
-                ),
-            )
+    def _queue_zone_resume(self, zone_id: int) -> None:
+        """Patch state, set optimistic flags and queue a resume (no notify)."""
+        old_state = patch_zone_resume(
+            self.coordinator.data.zone_states.get(zone_key(zone_id))
+        )
 
-        self.coordinator.async_update_listeners()
+        self.coordinator.optimistic.set_zone(zone_id, False)
+
+        self.coordinator.api_manager.queue_command(
+            f"zone_{zone_id}",
+            TadoCommand(
+                CommandType.RESUME_SCHEDULE,
+                zone_id=zone_id,
+                rollback_context=old_state,
+            ),
+        )
 
     async def async_boost_all_zones(self) -> None:
         """Boost all active heating zones to 25°C (v3)."""
@@ -104,7 +111,7 @@ class TadoV3ActionProvider(TadoActionProvider):
             )
 
             old_state = patch_zone_overlay(
-                self.coordinator.data.zone_states.get(str(zone_id)), data
+                self.coordinator.data.zone_states.get(zone_key(zone_id)), data
             )
 
             self.coordinator.optimistic.apply_zone_state(
@@ -161,7 +168,7 @@ class TadoV3ActionProvider(TadoActionProvider):
 
     async def async_set_ac_setting(self, zone_id: int, key: str, value: str) -> None:
         """Set an AC specific setting (v3) respecting hardware capabilities."""
-        state = self.coordinator.data.zone_states.get(str(zone_id))
+        state = self.coordinator.data.zone_states.get(zone_key(zone_id))
         if not state or not getattr(state, "setting", None):
             _LOGGER.error("Cannot set AC setting: No state for zone %d", zone_id)
             return
@@ -200,7 +207,7 @@ class TadoV3ActionProvider(TadoActionProvider):
         )
 
         old_state = patch_zone_overlay(
-            self.coordinator.data.zone_states.get(str(zone_id)), data
+            self.coordinator.data.zone_states.get(zone_key(zone_id)), data
         )
 
         self.coordinator.optimistic.apply_zone_state(
@@ -280,9 +287,9 @@ class TadoV3ActionProvider(TadoActionProvider):
         for cap_name, api_key, attr_name in swing_mappings:
             if cap_values := getattr(mode_caps, cap_name, None):
                 opt_val = (
-                    self.coordinator.optimistic._store.get("zone", {})
-                    .get(zone_id, {})
-                    .get(attr_name, (None, 0))[0]
+                    self.coordinator.optimistic._store.get(
+                        ("zone", zone_id, attr_name), (None, 0)
+                    )[0]
                 ) or getattr(state.setting, attr_name, None)
 
                 val = value if key == attr_name else opt_val
@@ -294,9 +301,9 @@ class TadoV3ActionProvider(TadoActionProvider):
                     else ("OFF" if "OFF" in cap_values else cap_values[0])
                 )
             elif opt_val := (
-                self.coordinator.optimistic._store.get("zone", {})
-                .get(zone_id, {})
-                .get(attr_name, (None, 0))[0]
+                self.coordinator.optimistic._store.get(
+                    ("zone", zone_id, attr_name), (None, 0)
+                )[0]
             ) or getattr(state.setting, attr_name, None):
                 val = opt_val.upper()
                 fields[api_key] = str(val)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from tadoasync.models import TemperatureOffset
@@ -43,8 +44,10 @@ class TadoV3Mapper:
 
     async def async_fetch_metadata(self) -> tuple[dict[int, Any], dict[str, Any]]:
         """Fetch static metadata (Slow Poll)."""
-        zones = await self.client.get_zones()
-        devices = await self.client.get_devices()
+        # Independent endpoints; fetch them concurrently
+        zones, devices = await asyncio.gather(
+            self.client.get_zones(), self.client.get_devices()
+        )
 
         zones_meta = {z.id: z for z in zones}
         devices_meta = {d.short_serial_no: d for d in devices}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 import homeassistant.util.dt as dt_util
@@ -36,32 +37,33 @@ def parse_heating_power(state: Any, zone_type: str | None = None) -> float:
     return 0.0
 
 
+# Resolved in C by attrgetter; a missing link anywhere in the chain
+# (None state, no overlay, no temperature) raises AttributeError.
+_NSC_TEMP = attrgetter("next_schedule_change.setting.temperature.celsius")
+_NSC_SETTING = attrgetter("next_schedule_change.setting")
+
+
 def parse_next_schedule_temp(state: Any) -> float | None:
     """Extract next schedule target temperature from v3 zone state."""
-    nsc = getattr(state, "next_schedule_change", None)
-    if not nsc:
-        return None
-    setting = getattr(nsc, "setting", None)
-    if not setting:
+    try:
+        return _NSC_TEMP(state) or None
+    except AttributeError:
         return None
-    temp = getattr(setting, "temperature", None)
-    return None if temp is None else temp.celsius or None
 
 
 def parse_next_schedule_mode(state: Any) -> str | None:
     """Extract next schedule mode from v3 zone state."""
-    if nsc := getattr(state, "next_schedule_change", None):
-        return (
-            (
-                (setting.power == "ON" and (setting.mode or "HEATING"))
-                or (setting.power == "OFF" and "OFF")
-            )
-            or None
-            if (setting := getattr(nsc, "setting", None))
-            else None
-        )
-    else:
+    try:
+        setting = _NSC_SETTING(state)
+    except AttributeError:
+        return None
+    if not setting:
         return None
+    return (
+        (setting.power == "ON" and (setting.mode or "HEATING"))
+        or (setting.power == "OFF" and "OFF")
+        or None
+    )
 
 
 def parse_next_time_block_start(state: Any) -> datetime | None:
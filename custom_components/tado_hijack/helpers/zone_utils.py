@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from ..const import ZONE_TYPE_HEATING
 
 
+@lru_cache(maxsize=128)
+def zone_key(zone_id: int) -> str:
+    """Return the zone-state dict key for a zone ID.
+
+    zone_states is keyed by string for provider consistency; caching the
+    coercion avoids a fresh str() allocation at every lookup site.
+    """
+    return str(zone_id)
+
+
 def get_zone_type(
     zone: Any | None, default: str | None = ZONE_TYPE_HEATING
 ) -> str | None:
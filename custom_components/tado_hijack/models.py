@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.helpers.entity import EntityCategory
@@ -29,7 +29,7 @@ class RateLimit:
     remaining: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoData:
     """Data structure to hold Tado data.
 
@@ -64,7 +64,7 @@ class CommandType(StrEnum):
     IDENTIFY = "identify"
 
 
-@dataclass
+@dataclass(slots=True)
 class TadoCommand:
     """Represents a queued API command."""
 
@@ -74,13 +74,16 @@ class TadoCommand:
     rollback_context: Any = None
 
 
-class TadoEntityDefinition(TypedDict, total=False):
-    """Define properties for a Tado entity."""
+@dataclass(slots=True, frozen=True)
+class TadoEntityDefinition:
+    """Define properties for a Tado entity.
+
+    Immutable and slotted: definitions are built once at import time and
+    read on every state access, so attribute lookups stay cheap.
+    """
 
     key: str
-    translation_key: str | None
-    unique_id_suffix: str | None
-    use_legacy_unique_id_format: bool | None
+    translation_key: str
     platform: str  # "sensor", "binary_sensor", etc.
     scope: str  # "home", "zone", "device", "hot_water", "bridge"
 
@@ -91,36 +94,39 @@ class TadoEntityDefinition(TypedDict, total=False):
     # - device: (coordinator, device_serial) -> value
     # - bridge: (coordinator, bridge_serial) -> value
     value_fn: Callable[..., Any]
-    is_supported_fn: Callable[..., bool] | None
-    press_fn: Callable[..., Any] | None
-    set_fn: Callable[..., Any] | None
-    turn_on_fn: Callable[..., Any] | None
-    turn_off_fn: Callable[..., Any] | None
+
+    unique_id_suffix: str | None = None
+    use_legacy_unique_id_format: bool | None = None
+    is_supported_fn: Callable[..., bool] | None = None
+    press_fn: Callable[..., Any] | None = None
+    set_fn: Callable[..., Any] | None = None
+    turn_on_fn: Callable[..., Any] | None = None
+    turn_off_fn: Callable[..., Any] | None = None
 
     # Select Entity Specifics
-    options_fn: Callable[..., list[str]] | None
-    select_option_fn: Callable[..., Any] | None
+    options_fn: Callable[..., list[str]] | None = None
+    select_option_fn: Callable[..., Any] | None = None
 
     # Standard HA Entity Properties
-    icon: str | None
-    ha_device_class: SensorDeviceClass | None
-    ha_state_class: SensorStateClass | None
-    ha_native_unit_of_measurement: str | None
-    suggested_display_precision: int | None
-    entity_category: EntityCategory | None
-    entity_registry_enabled_default: bool | None
-    supported_zone_types: set[str] | None
-    supported_generations: set[str] | None  # None = all generations
-    required_device_capabilities: list[str] | None
-    is_inverted: bool | None
+    icon: str | None = None
+    ha_device_class: SensorDeviceClass | None = None
+    ha_state_class: SensorStateClass | None = None
+    ha_native_unit_of_measurement: str | None = None
+    suggested_display_precision: int | None = None
+    entity_category: EntityCategory | None = None
+    entity_registry_enabled_default: bool = True
+    supported_zone_types: frozenset[str] | None = None
+    supported_generations: set[str] | None = None  # None = all generations
+    required_device_capabilities: list[str] | None = None
+    is_inverted: bool | None = None
 
     # Number Entity Specifics
-    min_value: float | None
-    max_value: float | None
-    step: float | None
-    min_fn: Callable[..., float] | None
-    max_fn: Callable[..., float] | None
-    step_fn: Callable[..., float] | None
-    optimistic_key: str | None
-    optimistic_scope: str | None
-    optimistic_value_map: dict[str, bool] | None
+    min_value: float | None = None
+    max_value: float | None = None
+    step: float | None = None
+    min_fn: Callable[..., float] | None = None
+    max_fn: Callable[..., float] | None = None
+    step_fn: Callable[..., float] | None = None
+    optimistic_key: str | None = None
+    optimistic_scope: str | None = None
+    optimistic_value_map: dict[str, bool] | None = None
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import contextlib
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -55,8 +54,10 @@ class TadoOptimisticNumber(TadoOptimisticMixin, RestoreEntity, NumberEntity):
         await super().async_added_to_hass()
         if (last_state := await self.async_get_last_state()) is not None:
             if last_state.state not in (None, "unknown", "unavailable"):
-                with contextlib.suppress(ValueError, TypeError):
+                try:
                     self._restored_value = float(last_state.state)
+                except (ValueError, TypeError):
+                    pass
 
     @property
     def native_value(self) -> float | int | None:
@@ -87,45 +88,44 @@ class TadoGenericNumberMixin(TadoDefinitionMixin):
         """Initialize generic number properties."""
         TadoDefinitionMixin.__init__(self, definition)
         self._attr_mode = NumberMode.BOX
-        self._attr_optimistic_key = definition.get("optimistic_key")
-        self._attr_optimistic_scope = definition.get("optimistic_scope")
+        self._attr_optimistic_key = definition.optimistic_key
+        self._attr_optimistic_scope = definition.optimistic_scope
 
-        if (min_val := definition.get("min_value")) is not None:
+        # Fixed by scope, so built once instead of per value read/write.
+        ctx_id = self._tado_entity_id
+        self._value_args: tuple[Any, ...] = (
+            (self.coordinator,) if ctx_id is None else (self.coordinator, ctx_id)
+        )
+
+        if (min_val := definition.min_value) is not None:
             self._attr_native_min_value = min_val
-        if (max_val := definition.get("max_value")) is not None:
+        if (max_val := definition.max_value) is not None:
             self._attr_native_max_value = max_val
-        if step := definition.get("step"):
+        if (step := definition.step) is not None:
             self._attr_native_step = step
-        if (precision := definition.get("suggested_display_precision")) is not None:
+        if (precision := definition.suggested_display_precision) is not None:
             self._attr_suggested_display_precision = precision
 
     def _update_dynamic_ranges(self) -> None:
         """Update min/max/step if dynamic functions are provided."""
-        ctx_id = self._tado_entity_id
-        if min_fn := self._definition.get("min_fn"):
-            self._attr_native_min_value = min_fn(self.coordinator, ctx_id)
-        if max_fn := self._definition.get("max_fn"):
-            self._attr_native_max_value = max_fn(self.coordinator, ctx_id)
-        if step_fn := self._definition.get("step_fn"):
-            self._attr_native_step = step_fn(self.coordinator, ctx_id)
+        definition = self._definition
+        args = self._value_args
+        if min_fn := definition.min_fn:
+            self._attr_native_min_value = min_fn(*args)
+        if max_fn := definition.max_fn:
+            self._attr_native_max_value = max_fn(*args)
+        if step_fn := definition.step_fn:
+            self._attr_native_step = step_fn(*args)
 
     def _get_actual_value(self) -> float | None:
         """Get actual value via value_fn."""
-        args = [self.coordinator]
-        if (ctx_id := self._tado_entity_id) is not None:
-            args.append(ctx_id)
-
-        val = self._definition["value_fn"](*args)
+        val = self._definition.value_fn(*self._value_args)
         return float(val) if val is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Set native value via set_fn."""
-        if set_fn := self._definition.get("set_fn"):
-            args: list[Any] = [self.coordinator]
-            if (ctx_id := self._tado_entity_id) is not None:
-                args.append(ctx_id)
-            args.append(value)
-            await set_fn(*args)
+        if set_fn := self._definition.set_fn:
+            await set_fn(*self._value_args, value)
 
 
 class TadoGenericDeviceNumber(
@@ -144,7 +144,7 @@ class TadoGenericDeviceNumber(
         TadoDeviceEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             device.serial_no,
             device.short_serial_no,
             device.device_type,
@@ -171,12 +171,12 @@ class TadoGenericZoneNumber(
         TadoZoneEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             zone_id,
             zone_name,
         )
         TadoGenericNumberMixin.__init__(self, definition)
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_zone_{zone_id}_{self._get_unique_id_suffix()}"
+        self._attr_unique_id = f"{coordinator.entry_id}_zone_{zone_id}_{self._get_unique_id_suffix()}"
         self._update_dynamic_ranges()
 
     async def async_added_to_hass(self) -> None:
@@ -184,7 +184,7 @@ class TadoGenericZoneNumber(
         await TadoOptimisticNumber.async_added_to_hass(self)
 
         # Re-fetch ranges on startup if they might be dynamic
-        if self._definition.get("min_fn") or self._definition.get("max_fn"):
+        if self._definition.min_fn or self._definition.max_fn:
             # Ensure capabilities are loaded for dynamic ranges (e.g. target_temp)
             await self.coordinator.async_get_capabilities(self._zone_id)
             self._update_dynamic_ranges()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -50,35 +50,40 @@ class TadoGenericZoneSelect(TadoZoneEntity, TadoGenericEntityMixin, SelectEntity
         TadoZoneEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             zone_id,
             zone_name,
         )
         TadoGenericEntityMixin.__init__(self, definition)
-        self._attr_options: list[str] = []
+        self._attr_options: tuple[str, ...] = ()
         self._option_map: dict[str, str] = {}
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{self._get_unique_id_suffix()}_{zone_id}"
+        self._options_set: frozenset[str] = frozenset()
+        # Raw API value -> lowercased option; bounded by the option
+        # cardinality, so it stays a handful of entries.
+        self._lower_cache: dict[str, str] = {}
+        self._attr_unique_id = f"{coordinator.entry_id}_{self._get_unique_id_suffix()}_{zone_id}"
 
     async def async_added_to_hass(self) -> None:
         """Fetch options on startup."""
         await super().async_added_to_hass()
-        if options_fn := self._definition.get("options_fn"):
+        if options_fn := self._definition.options_fn:
             # Ensure capabilities are loaded
             await self.coordinator.async_get_capabilities(self._zone_id)
             if source_options := options_fn(self.coordinator, self._zone_id):
                 self._option_map = {opt.lower(): opt for opt in source_options}
-                self._attr_options = sorted(self._option_map.keys())
+                self._attr_options = tuple(sorted(self._option_map))
+                self._options_set = frozenset(self._attr_options)
                 self.async_write_ha_state()
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
         val = self._get_actual_value()
-        if val is not None:
-            val_lower = str(val).lower()
-            if val_lower in self._attr_options:
-                return val_lower
-        return None
+        if val is None:
+            return None
+        if (val_lower := self._lower_cache.get(val)) is None:
+            val_lower = self._lower_cache[val] = str(val).lower()
+        return val_lower if val_lower in self._options_set else None
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
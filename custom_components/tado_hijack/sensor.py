@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -59,12 +59,12 @@ class TadoGenericHomeSensor(TadoHomeEntity, TadoGenericEntityMixin, SensorEntity
         """Initialize the generic home sensor."""
         # TadoHomeEntity sets the entity_id based on the key
         TadoHomeEntity.__init__(
-            self, coordinator, cast(str, definition["translation_key"])
+            self, coordinator, definition.translation_key
         )
         TadoGenericEntityMixin.__init__(self, definition)
-        self._set_entity_id("sensor", definition["key"])
+        self._set_entity_id("sensor", definition.key)
         self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{self._get_unique_id_suffix()}"
+            f"{coordinator.entry_id}_{self._get_unique_id_suffix()}"
         )
 
     @property
@@ -72,7 +72,7 @@ class TadoGenericHomeSensor(TadoHomeEntity, TadoGenericEntityMixin, SensorEntity
         """Return entity specific state attributes."""
         attrs = super().extra_state_attributes or {}
 
-        if self._definition["key"] == "quota_reset_next":
+        if self._definition.key == "quota_reset_next":
             attrs["learned"] = self.coordinator.reset_tracker.is_learned
 
         return attrs
@@ -89,10 +89,10 @@ class TadoGenericZoneSensor(TadoZoneEntity, TadoGenericEntityMixin, SensorEntity
         zone_name: str,
     ) -> None:
         """Initialize the generic zone sensor."""
-        trans_key = cast(str, definition["translation_key"])
+        trans_key = definition.translation_key
 
         # Special handling for heating_power label (v3 only - Tado X has no hot water zones)
-        if coordinator.generation != GEN_X and definition["key"] == "heating_power":
+        if coordinator.generation != GEN_X and definition.key == "heating_power":
             zone = coordinator.zones_meta.get(zone_id)
             if zone and zone.type == ZONE_TYPE_HOT_WATER:
                 trans_key = "hot_water_power"
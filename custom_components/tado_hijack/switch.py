@@ -8,7 +8,6 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .entity import (
-    TadoDefinitionMixin,
     TadoDeviceEntity,
     TadoGenericEntityMixin,
     TadoHomeEntity,
@@ -20,6 +19,8 @@ from .helpers.logging_utils import get_redacted_logger
 from .models import TadoEntityDefinition
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from . import TadoConfigEntry
     from .coordinator import TadoDataUpdateCoordinator
 
@@ -50,37 +51,36 @@ class TadoGenericSwitchMixin(TadoGenericEntityMixin):
 
     def __init__(self, definition: TadoEntityDefinition) -> None:
         """Initialize generic switch properties."""
-        TadoDefinitionMixin.__init__(self, definition)
-        self._attr_optimistic_key = definition.get("optimistic_key")
-        self._attr_optimistic_scope = definition.get("optimistic_scope")
+        TadoGenericEntityMixin.__init__(self, definition)
+        self._attr_optimistic_key = definition.optimistic_key
+        self._attr_optimistic_scope = definition.optimistic_scope
+
+        # Resolve the optimistic-value transform once (the definition is
+        # frozen), so each read is a single indirect call.
+        self._opt_transform: Callable[[Any], bool | None]
+        if mapping := definition.optimistic_value_map:
+            self._opt_transform = mapping.get
+        elif definition.is_inverted:
+            self._opt_transform = lambda v: not bool(v)
+        else:
+            self._opt_transform = bool
 
     def _get_optimistic_value(self) -> bool | None:
-        """Handle inverted optimistic values."""
-        if (
-            opt := TadoOptimisticMixin._get_optimistic_value(
-                cast(TadoOptimisticMixin, self)
-            )
-        ) is not None:
-            if mapping := self._definition.get("optimistic_value_map"):
-                return mapping.get(opt, None)
-            return not bool(opt) if self._definition.get("is_inverted") else bool(opt)
-        return None
+        """Handle inverted/mapped optimistic values."""
+        opt = TadoOptimisticMixin._get_optimistic_value(
+            cast(TadoOptimisticMixin, self)
+        )
+        return None if opt is None else self._opt_transform(opt)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn switch on via turn_on_fn."""
-        if turn_on_fn := self._definition.get("turn_on_fn"):
-            args = [self.coordinator]
-            if (ctx_id := self._tado_entity_id) is not None:
-                args.append(ctx_id)
-            await turn_on_fn(*args)
+        if turn_on_fn := self._definition.turn_on_fn:
+            await turn_on_fn(*self._value_args)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn switch off via turn_off_fn."""
-        if turn_off_fn := self._definition.get("turn_off_fn"):
-            args = [self.coordinator]
-            if (ctx_id := self._tado_entity_id) is not None:
-                args.append(ctx_id)
-            await turn_off_fn(*args)
+        if turn_off_fn := self._definition.turn_off_fn:
+            await turn_off_fn(*self._value_args)
 
 
 class TadoGenericHomeSwitch(
@@ -95,12 +95,12 @@ class TadoGenericHomeSwitch(
     ) -> None:
         """Initialize the generic home switch."""
         TadoHomeEntity.__init__(
-            self, coordinator, cast(str, definition["translation_key"])
+            self, coordinator, definition.translation_key
         )
         TadoGenericSwitchMixin.__init__(self, definition)
-        self._set_entity_id("switch", definition["key"])
+        self._set_entity_id("switch", definition.key)
         self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_{self._get_unique_id_suffix()}"
+            f"{coordinator.entry_id}_{self._get_unique_id_suffix()}"
         )
 
     @property
@@ -125,7 +125,7 @@ class TadoGenericZoneSwitch(
         TadoZoneEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             zone_id,
             zone_name,
         )
@@ -153,7 +153,7 @@ class TadoGenericDeviceSwitch(
         TadoDeviceEntity.__init__(
             self,
             coordinator,
-            cast(str, definition["translation_key"]),
+            definition.translation_key,
             device.serial_no,
             device.short_serial_no,
             device.device_type,
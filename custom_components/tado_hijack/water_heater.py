@@ -101,7 +101,7 @@ class TadoHotWater(
         """Initialize Tado hot water."""
         super().__init__(coordinator, "hot_water", zone_id, zone_name)
         self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}_water_heater_{zone_id}"
+            f"{coordinator.entry_id}_water_heater_{zone_id}"
         )
         # Register memory keys
         self._store_last_state("target_temperature", None)
@@ -137,14 +137,14 @@ class TadoHotWater(
         is_manual_intent = opt_overlay is True
         op_mode = str(self._resolve_state())
 
-        state = self.coordinator.data.zone_states.get(str(self._zone_id))
+        state = self.coordinator.data.zone_states.get(self._zone_id_str)
         api_has_overlay = bool(state and getattr(state, "overlay_active", False))
 
         return op_mode if api_has_overlay or is_manual_intent else OPERATION_MODE_AUTO
 
     def _get_actual_value(self) -> str:
         """Return actual operation mode from coordinator data."""
-        state = self.coordinator.data.zone_states.get(str(self._zone_id))
+        state = self.coordinator.data.zone_states.get(self._zone_id_str)
         if state is None:
             return OPERATION_MODE_AUTO
 
@@ -178,7 +178,7 @@ class TadoHotWater(
             return int(float(opt_temp))
 
         # Real API State
-        state = self.tado_coordinator.data.zone_states.get(str(self._zone_id))
+        state = self.tado_coordinator.data.zone_states.get(self._zone_id_str)
         if (temp := parse_schedule_temperature(state)) is not None:
             return int(temp)
 
@@ -194,7 +194,7 @@ class TadoHotWater(
             self.tado_coordinator.supports_temperature(self._zone_id)
             and self.current_operation == OPERATION_MODE_AUTO
         ):
-            state = self.coordinator.data.zone_states.get(str(self._zone_id))
+            state = self.coordinator.data.zone_states.get(self._zone_id_str)
             temp = parse_schedule_temperature(state)
             attrs["auto_target_temperature"] = int(temp) if temp is not None else None
 
@@ -211,7 +211,7 @@ class TadoHotWater(
         home_state = self.tado_coordinator.data.home_state
         if home_state is None:
             return False
-        return str(getattr(home_state, "presence", "")) == "AWAY"
+        return home_state.presence == "AWAY"
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set new operation mode."""